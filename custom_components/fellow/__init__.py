@@ -407,7 +407,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     async def handle_debug_water_usage(call: ServiceCall) -> ServiceResponse:
         coordinator = _get_coordinator(hass)
-        device_config = (coordinator.data or {}).get("device_config", {})
+        device_config = coordinator.device_config
         return {
             "water_usage_record_count": coordinator.history_manager.get_water_usage_count(),
             "current_device_total_ml": device_config.get("totalWaterVolumeL", 0),
@@ -418,7 +418,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     async def handle_reset_water_tracking(call: ServiceCall) -> None:
         coordinator = _get_coordinator(hass)
-        device_config = (coordinator.data or {}).get("device_config", {})
+        device_config = coordinator.device_config
         current_total = device_config.get("totalWaterVolumeL", 0)
         _LOGGER.info(
             "Resetting water tracking baseline to %d ml (%.2f L)",
@@ -515,7 +515,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: FellowAidenConfigEntry)
 
 async def async_unload_entry(hass: HomeAssistant, entry: FellowAidenConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.history_manager.async_flush()
+    return unload_ok
 
 
 async def _async_update_options(hass: HomeAssistant, entry: FellowAidenConfigEntry) -> None:
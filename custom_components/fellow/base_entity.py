@@ -1,6 +1,10 @@
 """Base entity for Fellow Aiden."""
 from __future__ import annotations
 
+from abc import abstractmethod
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH, CONNECTION_NETWORK_MAC, DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -16,7 +20,7 @@ class FellowAidenBaseEntity(CoordinatorEntity):
     def device_info(self) -> DeviceInfo:
         """Return device info for the brewer device registry."""
         data = self.coordinator.data or {}
-        device_config = data.get("device_config", {})
+        device_config = self.coordinator.device_config
 
         brewer_id = device_config.get("id") or getattr(self, "_entry_id", None)
         fw_version = device_config.get("firmwareVersion")
@@ -41,3 +45,38 @@ class FellowAidenBaseEntity(CoordinatorEntity):
             hw_version=hw_version,
             connections=connections,
         )
+
+
+class FellowAidenComputedEntity(FellowAidenBaseEntity):
+    """Base for entities whose state is derived once per coordinator update.
+
+    Subclasses set their _attr_* values in _update_from_coordinator and
+    return the values that make up their state from _state_values. The
+    state is only written when those values or availability changed.
+    """
+
+    _last_state: tuple[Any, ...] | None = None
+
+    @abstractmethod
+    def _update_from_coordinator(self) -> None:
+        """Derive the entity's _attr_* values from the coordinator data."""
+
+    @abstractmethod
+    def _state_values(self) -> tuple[Any, ...]:
+        """Return the derived values that make up the entity's state."""
+
+    async def async_added_to_hass(self) -> None:
+        """Derive the initial state before the first state write."""
+        await super().async_added_to_hass()
+        self._update_from_coordinator()
+        self._last_state = (self.available, *self._state_values())
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Re-derive the state and write it only if it changed."""
+        self._update_from_coordinator()
+        state = (self.available, *self._state_values())
+        if state == self._last_state:
+            return
+        self._last_state = state
+        super()._handle_coordinator_update()
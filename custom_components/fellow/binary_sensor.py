@@ -36,19 +36,17 @@ async def async_setup_entry(
     """Set up Fellow Aiden binary sensors."""
     coordinator = entry.runtime_data
 
-    entities: list[FellowAidenBinarySensor] = []
-    for key, device_class, translation_key in BINARY_SENSORS:
-        entities.append(
-            FellowAidenBinarySensor(
-                coordinator=coordinator,
-                entry=entry,
-                key=key,
-                translation_key=translation_key,
-                device_class=device_class,
-            )
+    # The coordinator has already refreshed, so the entities have data when added
+    async_add_entities(
+        FellowAidenBinarySensor(
+            coordinator=coordinator,
+            entry=entry,
+            key=key,
+            translation_key=translation_key,
+            device_class=device_class,
         )
-
-    async_add_entities(entities, True)
+        for key, device_class, translation_key in BINARY_SENSORS
+    )
 
 
 class FellowAidenBinarySensor(FellowAidenBaseEntity, BinarySensorEntity):
@@ -77,9 +75,7 @@ class FellowAidenBinarySensor(FellowAidenBaseEntity, BinarySensorEntity):
         closed, but HA's DOOR class expects True to mean "open".
         We invert the value for that key.
         """
-        data = self.coordinator.data or {}
-        device_config = data.get("device_config", {})
-        raw_value = device_config.get(self._key)
+        raw_value = self.coordinator.device_config.get(self._key)
 
         if self._key == "lidClosed":
             if raw_value is None:
@@ -2,18 +2,106 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
-from typing import Any
+from functools import lru_cache
+from typing import Any, Self
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers import storage
 
-from .const import HISTORY_RETENTION_DAYS, MIN_HISTORICAL_DATA_FOR_ACCURACY
+from .const import (
+    HISTORY_RETENTION_DAYS,
+    HISTORY_SAVE_DELAY_SECONDS,
+    MAX_HISTORY_RECORDS,
+    MIN_HISTORICAL_DATA_FOR_ACCURACY,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _parse_timestamp(timestamp_str: str) -> datetime | None:
+    """Parse a stored ISO timestamp into an aware datetime, or None if unparseable."""
+    try:
+        record_dt = datetime.fromisoformat(timestamp_str)
+    except (ValueError, TypeError):
+        _LOGGER.debug("Failed to parse timestamp: %s", timestamp_str)
+        return None
+    # Ensure timezone awareness for comparison
+    if record_dt.tzinfo is None:
+        record_dt = dt_util.as_local(record_dt)
+    return record_dt
+
+
+class _HistoryRecord:
+    """Conversion between slotted history records and their stored dict form."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Build a record from its stored form, ignoring unknown keys."""
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stored form, leaving out unset optional fields."""
+        return {
+            f.name: value
+            for f in fields(self)
+            if (value := getattr(self, f.name)) is not None
+        }
+
+
+@dataclass(slots=True)
+class BrewRecord(_HistoryRecord):
+    """One or more brews detected in a single poll."""
+
+    timestamp: str = ""
+    total_brews_at_time: int = 0
+    total_water_at_time: int = 0
+    count: int = 1
+    start_time: str | None = None
+    end_time: str | None = None
+    duration_seconds: int | None = None
+    profile_id: str | None = None
+    profile_title: str | None = None
+
+
+@dataclass(slots=True)
+class WaterRecord(_HistoryRecord):
+    """Water dispensed between two polls."""
+
+    timestamp: str = ""
+    water_used_ml: int = 0
+    total_water_at_time: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class HistorySnapshot:
+    """History query results, taken once per coordinator update for the sensors."""
+
+    last_brew_time: datetime | None = None
+    average_time_between_brews: float | None = None
+    average_brew_duration: float | None = None
+    brew_history_count: int = 0
+    water_usage_count: int = 0
+    # Keyed by period length in days
+    water_usage: dict[int, float] = field(default_factory=dict)
+    brew_count: dict[int, int] = field(default_factory=dict)
+
+
+def _record_epoch(record: BrewRecord | WaterRecord) -> float | None:
+    """Return a record's timestamp as epoch seconds, or None if unparseable."""
+    if not record.timestamp:
+        return None
+    record_dt = _parse_timestamp(record.timestamp)
+    return record_dt.timestamp() if record_dt is not None else None
+
+
 class BrewHistoryManager:
     """Manages historical brew data storage and calculations using async file operations."""
 
@@ -22,70 +110,179 @@ class BrewHistoryManager:
         self.hass = hass
         self.entry_id = entry_id
         self._store = storage.Store(hass, 1, f"fellow_aiden_history_{entry_id}")
-        self._brew_history: list[dict[str, Any]] = []
-        self._water_usage_history: list[dict[str, Any]] = []
-        self._profile_usage: dict[str, int] = {}
+        self._brew_history: list[BrewRecord] = []
+        self._water_usage_history: list[WaterRecord] = []
+        self._profile_usage: Counter[str] = Counter()
+        # Running sum of _profile_usage, kept in step with it
+        self._profile_usage_total = 0
         self._last_total_brews = 0
         self._last_total_water = 0
         self._data_loaded = False
+        self._save_pending = False
+        # Column views parallel to the record lists, sorted by timestamp, so
+        # period queries are a bisect plus a slice instead of a parse-per-record scan
+        self._brew_ts: list[float] = []
+        self._brew_duration_s: list[int] = []
+        self._brew_count: list[int] = []
+        self._water_ts: list[float] = []
+        self._water_ml: list[int] = []
+
+    def _rebuild_columns(self) -> None:
+        """Sort the record lists by time and rebuild the parallel columns.
+
+        Records without a parseable timestamp are dropped; they could never
+        match a period query and the retention cleanup would discard them anyway.
+        """
+        record_epoch = _record_epoch
+        brews = [(ts, r) for r in self._brew_history if (ts := record_epoch(r)) is not None]
+        brews.sort(key=lambda item: item[0])
+        del brews[:-MAX_HISTORY_RECORDS]
+        self._brew_history = [r for _, r in brews]
+        self._brew_ts = [ts for ts, _ in brews]
+        self._brew_duration_s = [r.duration_seconds or 0 for r in self._brew_history]
+        self._brew_count = [r.count for r in self._brew_history]
+
+        water = [(ts, r) for r in self._water_usage_history if (ts := record_epoch(r)) is not None]
+        water.sort(key=lambda item: item[0])
+        del water[:-MAX_HISTORY_RECORDS]
+        self._water_usage_history = [r for _, r in water]
+        self._water_ts = [ts for ts, _ in water]
+        self._water_ml = [r.water_used_ml for r in self._water_usage_history]
+
+    def _append_brew_record(self, record: BrewRecord, timestamp: float) -> None:
+        """Insert a brew record, keeping the columns sorted by time."""
+        index = bisect_right(self._brew_ts, timestamp)
+        self._brew_history.insert(index, record)
+        self._brew_ts.insert(index, timestamp)
+        self._brew_duration_s.insert(index, record.duration_seconds or 0)
+        self._brew_count.insert(index, record.count)
+        if len(self._brew_ts) > MAX_HISTORY_RECORDS:
+            # Hard cap on top of day-based retention: evict the oldest records
+            excess = len(self._brew_ts) - MAX_HISTORY_RECORDS
+            del self._brew_history[:excess]
+            del self._brew_ts[:excess]
+            del self._brew_duration_s[:excess]
+            del self._brew_count[:excess]
+
+    def _append_water_record(self, record: WaterRecord, timestamp: float) -> None:
+        """Insert a water usage record, keeping the columns sorted by time."""
+        index = bisect_right(self._water_ts, timestamp)
+        self._water_usage_history.insert(index, record)
+        self._water_ts.insert(index, timestamp)
+        self._water_ml.insert(index, record.water_used_ml)
+        if len(self._water_ts) > MAX_HISTORY_RECORDS:
+            excess = len(self._water_ts) - MAX_HISTORY_RECORDS
+            del self._water_usage_history[:excess]
+            del self._water_ts[:excess]
+            del self._water_ml[:excess]
 
     async def async_load_history(self) -> None:
         """Load historical data from storage."""
         try:
             data = await self._store.async_load()
             if data is not None:
-                self._brew_history = data.get("brew_history", [])
-                self._water_usage_history = data.get("water_usage_history", [])
-                self._profile_usage = data.get("profile_usage", {})
+                self._brew_history = [
+                    BrewRecord.from_dict(r) for r in data.get("brew_history", [])
+                ]
+                self._water_usage_history = [
+                    WaterRecord.from_dict(r) for r in data.get("water_usage_history", [])
+                ]
+                self._profile_usage = Counter(data.get("profile_usage", {}))
+                self._profile_usage_total = sum(self._profile_usage.values())
                 self._last_total_brews = data.get("last_total_brews", 0)
                 self._last_total_water = data.get("last_total_water", 0)
                 _LOGGER.debug("Loaded brew history: %d brews, %d water records", 
                             len(self._brew_history), len(self._water_usage_history))
+            self._rebuild_columns()
+            self._clean_old_records(dt_util.now() - timedelta(days=HISTORY_RETENTION_DAYS))
             self._data_loaded = True
         except Exception as e:
             _LOGGER.error("Failed to load brew history: %s", e)
             self._brew_history = []
             self._water_usage_history = []
-            self._profile_usage = {}
+            self._profile_usage = Counter()
+            self._profile_usage_total = 0
+            self._rebuild_columns()
             self._data_loaded = True
 
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the storage payload for the current history.
+
+        Store calls this when a delayed save actually writes, so the pending
+        flag is cleared here rather than only on explicit saves.
+        """
+        self._save_pending = False
+        return {
+            "brew_history": [r.as_dict() for r in self._brew_history],
+            "water_usage_history": [r.as_dict() for r in self._water_usage_history],
+            "profile_usage": dict(self._profile_usage),
+            "last_total_brews": self._last_total_brews,
+            "last_total_water": self._last_total_water,
+            "last_updated": dt_util.now().isoformat()
+        }
+
     async def _async_save_history(self) -> None:
         """Save historical data to storage."""
         if not self._data_loaded:
             return
             
         try:
-            data = {
-                "brew_history": self._brew_history,
-                "water_usage_history": self._water_usage_history,
-                "profile_usage": self._profile_usage,
-                "last_total_brews": self._last_total_brews,
-                "last_total_water": self._last_total_water,
-                "last_updated": dt_util.now().isoformat()
-            }
-            await self._store.async_save(data)
+            await self._store.async_save(self._data_to_save())
             _LOGGER.debug("Saved brew history")
         except Exception as e:
             _LOGGER.error("Failed to save brew history: %s", e)
 
-    async def async_update_data(self, device_config: dict[str, Any], profiles: list[dict[str, Any]]) -> None:
-        """Update historical data with new device information."""
+    def _schedule_save(self) -> None:
+        """Coalesce history writes into one delayed save.
+
+        Every save rewrites the whole file, so bursts of changes are batched
+        instead of rewriting the history once per poll.
+        """
+        if not self._data_loaded:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, HISTORY_SAVE_DELAY_SECONDS)
+
+    async def async_flush(self) -> None:
+        """Write any delayed save immediately (used on unload)."""
+        if self._save_pending:
+            await self._async_save_history()
+
+    async def async_update_data(
+        self, device_config: dict[str, Any], brew_profile: dict[str, Any] | None
+    ) -> None:
+        """Update historical data with new device information.
+
+        New brews are attributed to brew_profile, since the API does not
+        report which profile a brew used.
+        """
         # Ensure data is loaded first
         if not self._data_loaded:
             await self.async_load_history()
             
         current_total_brews = device_config.get("totalBrewingCycles", 0)
         current_total_water = device_config.get("totalWaterVolumeL", 0)
+        needs_baseline = (
+            self._last_total_brews == 0 and self._last_total_water == 0
+            and not self._brew_history and not self._water_usage_history
+        )
+
+        # Idle brewer (the common case every poll): nothing to record
+        if (not needs_baseline
+                and current_total_brews <= self._last_total_brews
+                and current_total_water <= self._last_total_water):
+            return
+
         brew_start_time = device_config.get("brewStartTime")
         brew_end_time = device_config.get("brewEndTime")
 
         now = dt_util.now()
+        now_ts = now.timestamp()
         data_changed = False
         
         # Initialize baselines if this is the first time we're tracking
         # and we don't have any historical data
-        if (self._last_total_brews == 0 and self._last_total_water == 0 and 
-            len(self._brew_history) == 0 and len(self._water_usage_history) == 0):
+        if needs_baseline:
             _LOGGER.info("Initializing water usage tracking baseline: %d brews, %d ml water", 
                         current_total_brews, current_total_water)
             self._last_total_brews = current_total_brews
@@ -97,182 +294,140 @@ class BrewHistoryManager:
             new_brews = current_total_brews - self._last_total_brews
             _LOGGER.info("Detected %d new brew(s)", new_brews)
             
-            # Add brew record(s)
-            for i in range(new_brews):
-                brew_record = {
-                    "timestamp": now.isoformat(),
-                    "total_brews_at_time": current_total_brews - (new_brews - 1 - i),
-                    "total_water_at_time": current_total_water,
-                }
-                
-                # Add timing information if available
-                if brew_start_time and brew_end_time:
-                    try:
-                        start_ts = int(brew_start_time)
-                        end_ts = int(brew_end_time)
-                        if start_ts > 0 and end_ts > 0 and start_ts < end_ts:
-                            start_dt = dt_util.as_local(dt_util.utc_from_timestamp(start_ts))
-                            end_dt = dt_util.as_local(dt_util.utc_from_timestamp(end_ts))
-                            brew_record["start_time"] = start_dt.isoformat()
-                            brew_record["end_time"] = end_dt.isoformat()
-                            brew_record["duration_seconds"] = end_ts - start_ts
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Try to determine the profile used (get default or first profile)
-                if profiles:
-                    default_profile = next(
-                        (p for p in profiles if p.get("isDefaultProfile")), 
-                        profiles[0] if profiles else None
-                    )
-                    if default_profile:
-                        profile_id = default_profile.get("id")
-                        profile_title = default_profile.get("title", "Unknown Profile")
-                        brew_record["profile_id"] = profile_id
-                        brew_record["profile_title"] = profile_title
-                        
-                        # Update profile usage counter
-                        if profile_title in self._profile_usage:
-                            self._profile_usage[profile_title] += 1
-                        else:
-                            self._profile_usage[profile_title] = 1
-                
-                self._brew_history.append(brew_record)
-            
+            # Brews detected in the same poll share a timestamp and profile,
+            # so they are stored as one record carrying the count
+            brew_record = BrewRecord(
+                timestamp=now.isoformat(),
+                total_brews_at_time=current_total_brews,
+                total_water_at_time=current_total_water,
+                count=new_brews,
+            )
+
+            # Add timing information if available
+            if brew_start_time and brew_end_time:
+                try:
+                    start_ts = int(brew_start_time)
+                    end_ts = int(brew_end_time)
+                    if start_ts > 0 and end_ts > 0 and start_ts < end_ts:
+                        start_dt = dt_util.as_local(dt_util.utc_from_timestamp(start_ts))
+                        end_dt = dt_util.as_local(dt_util.utc_from_timestamp(end_ts))
+                        brew_record.start_time = start_dt.isoformat()
+                        brew_record.end_time = end_dt.isoformat()
+                        brew_record.duration_seconds = end_ts - start_ts
+                except (ValueError, TypeError):
+                    pass
+
+            if brew_profile:
+                profile_title = brew_profile.get("title", "Unknown Profile")
+                brew_record.profile_id = brew_profile.get("id")
+                brew_record.profile_title = profile_title
+
+                # Update profile usage counter
+                self._profile_usage[profile_title] += new_brews
+                self._profile_usage_total += new_brews
+
+            self._append_brew_record(brew_record, now_ts)
+
             self._last_total_brews = current_total_brews
             data_changed = True
         
         # Check if water usage changed
         if current_total_water > self._last_total_water:
             water_used = current_total_water - self._last_total_water
-            water_record = {
-                "timestamp": now.isoformat(),
-                "water_used_ml": water_used,
-                "total_water_at_time": current_total_water,
-            }
-            self._water_usage_history.append(water_record)
+            water_record = WaterRecord(
+                timestamp=now.isoformat(),
+                water_used_ml=water_used,
+                total_water_at_time=current_total_water,
+            )
+            self._append_water_record(water_record, now_ts)
             self._last_total_water = current_total_water
             _LOGGER.debug("Recorded water usage: %d ml", water_used)
             data_changed = True
         
         if data_changed:
-            # Clean old records based on retention policy
-            cutoff_date = now - timedelta(days=HISTORY_RETENTION_DAYS)
-            self._clean_old_records(cutoff_date)
-            
             # Save updated history
-            await self._async_save_history()
+            self._schedule_save()
 
-    def _clean_old_records(self, cutoff_date: datetime) -> None:
-        """Remove records older than cutoff date."""
+    @callback
+    def async_prune_old_records(self) -> None:
+        """Apply the retention policy; scheduled daily by the coordinator."""
+        cutoff_date = dt_util.now() - timedelta(days=HISTORY_RETENTION_DAYS)
+        if self._clean_old_records(cutoff_date):
+            self._schedule_save()
+
+    def _clean_old_records(self, cutoff_date: datetime) -> bool:
+        """Remove records older than cutoff date. Returns True if any were removed."""
         original_brew_count = len(self._brew_history)
         original_water_count = len(self._water_usage_history)
 
-        def is_record_recent(record: dict) -> bool:
-            """Check if a record is more recent than cutoff_date."""
-            timestamp_str = record.get("timestamp", "")
-            if not timestamp_str:
-                return False
-            try:
-                record_dt = datetime.fromisoformat(timestamp_str)
-                # Ensure timezone awareness for comparison
-                if record_dt.tzinfo is None:
-                    record_dt = dt_util.as_local(record_dt)
-                return record_dt > cutoff_date
-            except (ValueError, TypeError):
-                _LOGGER.debug("Failed to parse timestamp: %s", timestamp_str)
-                return False
-
-        self._brew_history = [
-            record for record in self._brew_history
-            if is_record_recent(record)
-        ]
+        # Columns are sorted by time, so stale records form a prefix
+        cutoff_ts = cutoff_date.timestamp()
+        brew_stale = bisect_right(self._brew_ts, cutoff_ts)
+        del self._brew_history[:brew_stale]
+        del self._brew_ts[:brew_stale]
+        del self._brew_duration_s[:brew_stale]
+        del self._brew_count[:brew_stale]
 
-        self._water_usage_history = [
-            record for record in self._water_usage_history
-            if is_record_recent(record)
-        ]
+        water_stale = bisect_right(self._water_ts, cutoff_ts)
+        del self._water_usage_history[:water_stale]
+        del self._water_ts[:water_stale]
+        del self._water_ml[:water_stale]
+
+        if not brew_stale and not water_stale:
+            return False
 
-        if len(self._brew_history) < original_brew_count or len(self._water_usage_history) < original_water_count:
-            _LOGGER.debug("Cleaned old records: %d->%d brews, %d->%d water",
-                         original_brew_count, len(self._brew_history),
-                         original_water_count, len(self._water_usage_history))
+        _LOGGER.debug("Cleaned old records: %d->%d brews, %d->%d water",
+                     original_brew_count, len(self._brew_history),
+                     original_water_count, len(self._water_usage_history))
+        return True
 
     def get_average_time_between_brews(self) -> float | None:
         """Calculate average time between brews in hours."""
-        if len(self._brew_history) < MIN_HISTORICAL_DATA_FOR_ACCURACY:
-            return None
-        
-        # Get timestamps of brews
-        timestamps = []
-        for record in self._brew_history:
-            try:
-                ts = datetime.fromisoformat(record["timestamp"])
-                # Ensure timezone awareness for comparison
-                if ts.tzinfo is None:
-                    ts = dt_util.as_local(ts)
-                timestamps.append(ts)
-            except (ValueError, KeyError):
-                continue
-        
+        timestamps = self._brew_ts
         if len(timestamps) < MIN_HISTORICAL_DATA_FOR_ACCURACY:
             return None
-        
-        # Sort timestamps
-        timestamps.sort()
-        
-        # Calculate intervals
-        intervals = []
-        for i in range(1, len(timestamps)):
-            interval = (timestamps[i] - timestamps[i-1]).total_seconds() / 3600  # Convert to hours
-            if interval > 0:  # Ignore negative or zero intervals
-                intervals.append(interval)
-        
+
+        # The column is already sorted, so adjacent differences are the intervals
+        intervals = [
+            later - earlier
+            for earlier, later in zip(timestamps, timestamps[1:])
+            if later > earlier  # Ignore zero intervals (same-poll brews)
+        ]
         if intervals:
-            return round(sum(intervals) / len(intervals), 1)
-        
+            return round(sum(intervals) / len(intervals) / 3600, 1)  # Convert to hours
+
         return None
 
     def get_water_usage_for_period(self, days: int) -> float:
-        """Get total water usage for the specified number of days."""
-        if not self._water_usage_history:
-            _LOGGER.debug("No water usage history available for %d-day period", days)
-            return 0.0
-
-        cutoff_date = dt_util.now() - timedelta(days=days)
+        """Get total water usage in liters for the specified number of days."""
+        return self.get_water_usage_for_periods(days)[days]
 
-        total_water = 0.0
-        matching_records = 0
-        for record in self._water_usage_history:
-            timestamp_str = record.get("timestamp", "")
-            if timestamp_str:
-                try:
-                    record_dt = datetime.fromisoformat(timestamp_str)
-                    if record_dt.tzinfo is None:
-                        record_dt = dt_util.as_local(record_dt)
-                    if record_dt > cutoff_date:
-                        water_used = record.get("water_used_ml", 0)
-                        total_water += water_used
-                        matching_records += 1
-                        _LOGGER.debug("Found water usage record: %dml on %s", water_used, timestamp_str)
-                except (ValueError, TypeError):
-                    continue
+    def get_water_usage_for_periods(self, *periods: int) -> dict[int, float]:
+        """Get total water usage in liters for several periods at once.
 
-        total_liters = round(total_water / 1000.0, 2)
-        _LOGGER.debug("Water usage for %d-day period: %d records, %dml (%sL)", days, matching_records, total_water, total_liters)
-        return total_liters
+        Shorter periods are suffixes of longer ones, so walking them from the
+        shortest outwards adds each record in the longest window exactly once.
+        """
+        totals: dict[int, float] = {}
+        now = dt_util.now()
+        end = len(self._water_ml)
+        total_water = 0
+        for days in sorted(periods):
+            start = bisect_right(self._water_ts, (now - timedelta(days=days)).timestamp())
+            total_water += sum(self._water_ml[start:end])
+            end = start
+            totals[days] = round(total_water / 1000.0, 2)
+            _LOGGER.debug(
+                "Water usage for %d-day period: %d records, %sL",
+                days, len(self._water_ml) - start, totals[days],
+            )
+        return totals
 
     def get_average_brew_duration(self) -> float | None:
         """Calculate average brew duration in minutes."""
-        durations = []
-        
-        for record in self._brew_history:
-            duration = record.get("duration_seconds")
-            if duration and duration > 0:
-                durations.append(duration / 60.0)  # Convert to minutes
-        
+        durations = [duration for duration in self._brew_duration_s if duration > 0]
         if durations:
-            return round(sum(durations) / len(durations), 1)
+            return round(sum(durations) / len(durations) / 60.0, 1)  # Convert to minutes
         
         return None
 
@@ -282,16 +437,20 @@ class BrewHistoryManager:
             return None
         
         # Find profile with highest usage count
-        most_used = max(self._profile_usage.items(), key=lambda x: x[1])
-        return most_used[0]
+        return self._profile_usage.most_common(1)[0][0]
 
     def get_profile_usage_stats(self) -> dict[str, int]:
         """Get profile usage statistics."""
-        return self._profile_usage.copy()
+        return dict(self._profile_usage)
+
+    @property
+    def profile_usage_total(self) -> int:
+        """Total number of brews counted in the profile usage stats."""
+        return self._profile_usage_total
 
     def get_brew_history_count(self) -> int:
-        """Get the total number of brew history records."""
-        return len(self._brew_history)
+        """Get the total number of brews in the history records."""
+        return sum(self._brew_count)
 
     def get_water_usage_count(self) -> int:
         """Get the total number of water usage history records."""
@@ -302,48 +461,36 @@ class BrewHistoryManager:
         if not self._brew_history:
             return 0
 
-        cutoff_date = dt_util.now() - timedelta(days=days)
-
-        count = 0
-        for record in self._brew_history:
-            timestamp_str = record.get("timestamp", "")
-            if timestamp_str:
-                try:
-                    record_dt = datetime.fromisoformat(timestamp_str)
-                    if record_dt.tzinfo is None:
-                        record_dt = dt_util.as_local(record_dt)
-                    if record_dt > cutoff_date:
-                        count += 1
-                except (ValueError, TypeError):
-                    continue
-
-        return count
+        cutoff_ts = (dt_util.now() - timedelta(days=days)).timestamp()
+        return sum(self._brew_count[bisect_right(self._brew_ts, cutoff_ts):])
 
     def get_last_brew_time(self) -> datetime | None:
         """Get the timestamp of the last brew."""
         if not self._brew_history:
             return None
         
-        # Get the most recent brew
-        latest_record = max(self._brew_history, key=lambda x: x.get("timestamp", ""))
-        
-        try:
-            dt = datetime.fromisoformat(latest_record["timestamp"])
-            # Ensure timezone is set
-            if dt.tzinfo is None:
-                return dt_util.as_local(dt)
-            return dt
-        except (ValueError, KeyError):
-            return None
+        # Records are kept sorted by time, so the most recent brew is last
+        latest_record = self._brew_history[-1]
+        return _parse_timestamp(latest_record.timestamp)
     
+    def snapshot(self) -> HistorySnapshot:
+        """Run every sensor-facing query once and return the results."""
+        return HistorySnapshot(
+            last_brew_time=self.get_last_brew_time(),
+            average_time_between_brews=self.get_average_time_between_brews(),
+            average_brew_duration=self.get_average_brew_duration(),
+            brew_history_count=self.get_brew_history_count(),
+            water_usage_count=self.get_water_usage_count(),
+            water_usage=self.get_water_usage_for_periods(1, 7, 30),
+            brew_count={days: self.get_brew_count_for_period(days) for days in (7, 30)},
+        )
+
     def debug_water_usage_history(self) -> None:
         """Debug method to log all water usage history."""
         _LOGGER.info("Water usage history (%d records):", len(self._water_usage_history))
         for i, record in enumerate(self._water_usage_history):
-            timestamp = record.get("timestamp", "Unknown")
-            water_used = record.get("water_used_ml", 0)
-            total_at_time = record.get("total_water_at_time", 0)
-            _LOGGER.info("  %d. %s: +%sml (total: %sml)", i+1, timestamp, water_used, total_at_time)
+            _LOGGER.info("  %d. %s: +%sml (total: %sml)", i+1, record.timestamp or "Unknown",
+                         record.water_used_ml, record.total_water_at_time)
         
         if not self._water_usage_history:
             _LOGGER.info("  No water usage records found")
@@ -353,6 +500,8 @@ class BrewHistoryManager:
         """Reset water usage tracking with a new baseline."""
         _LOGGER.info("Resetting water usage tracking baseline to %d ml", current_total_water)
         self._water_usage_history.clear()
+        self._water_ts.clear()
+        self._water_ml.clear()
         self._last_total_water = current_total_water
         await self._async_save_history()
         _LOGGER.info("Water usage tracking reset complete")
\ No newline at end of file
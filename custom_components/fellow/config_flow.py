@@ -17,16 +17,30 @@ from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL_MINUTES, MIN_UPDATE_INTERVAL_
 
 _LOGGER = logging.getLogger(__name__)
 
+PASSWORD_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.PASSWORD))
+
 USER_SCHEMA = vol.Schema(
     {
         vol.Required("email"): TextSelector(TextSelectorConfig(type=TextSelectorType.EMAIL)),
-        vol.Required("password"): TextSelector(TextSelectorConfig(type=TextSelectorType.PASSWORD)),
+        vol.Required("password"): PASSWORD_SELECTOR,
     }
 )
 
+REAUTH_SCHEMA = vol.Schema({vol.Required("password"): PASSWORD_SELECTOR})
+
+# Only the default differs between option form renders, so the validator is shared
+UPDATE_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_UPDATE_INTERVAL_SECONDS, max=300),
+)
+
 
 async def _try_login(hass: HomeAssistant, email: str, password: str) -> None:
-    """Attempt to authenticate asynchronously. Raises on failure."""
+    """Attempt to authenticate asynchronously. Raises on failure.
+
+    The client itself holds no connection state: HA's shared session keeps
+    the TCP/TLS pool warm, so building a fresh client per attempt is cheap.
+    """
     session = async_get_clientsession(hass)
     api = FellowAiden(email, password, session)
     await api.authenticate()
@@ -97,13 +111,7 @@ class FellowAidenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("password"): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.PASSWORD)
-                    ),
-                }
-            ),
+            data_schema=REAUTH_SCHEMA,
             errors=errors,
         )
 
@@ -170,10 +178,7 @@ class FellowAidenOptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Optional(
                         "update_interval_seconds",
                         default=current_interval,
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=MIN_UPDATE_INTERVAL_SECONDS, max=300),
-                    ),
+                    ): UPDATE_INTERVAL_VALIDATOR,
                 }
             ),
             errors=errors,
@@ -16,10 +16,14 @@ PLATFORMS = ["sensor", "select", "binary_sensor"]
 # Update intervals
 DEFAULT_UPDATE_INTERVAL_MINUTES = 1
 MIN_UPDATE_INTERVAL_SECONDS = 30
+MAX_FAILURE_BACKOFF_MINUTES = 30  # Upper bound for the polling interval while the API is failing
 
 
 # Historical data constants
 HISTORY_RETENTION_DAYS = 365
+HISTORY_PRUNE_INTERVAL_HOURS = 24
+MAX_HISTORY_RECORDS = 50_000  # Hard cap per history list, well above a year of home use
+HISTORY_SAVE_DELAY_SECONDS = 60  # Coalesce history writes; flushed on unload
 TIMESTAMP_2024_01_01 = 1704067201  # Used for timestamp validation
 MIN_VALID_YEAR = 2023
 
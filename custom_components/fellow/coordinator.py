@@ -1,22 +1,151 @@
 """Coordinator to fetch data from the Fellow Aiden cloud."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
+import random
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .fellow_aiden import FellowAiden, FellowAuthError
-from .brew_history import BrewHistoryManager
-from .const import DEFAULT_UPDATE_INTERVAL_MINUTES
+from .brew_history import BrewHistoryManager, HistorySnapshot
+from .const import (
+    DEFAULT_UPDATE_INTERVAL_MINUTES,
+    HISTORY_PRUNE_INTERVAL_HOURS,
+    MAX_FAILURE_BACKOFF_MINUTES,
+    MIN_VALID_YEAR,
+    TIMESTAMP_2024_01_01,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device config fields holding the last brew's start and end times
+BREW_TIME_KEYS = ("brewStartTime", "brewEndTime")
+
+
+@dataclass(frozen=True, slots=True)
+class DerivedData:
+    """Profile lookups and brew times, derived once per coordinator update."""
+
+    # Profile titles in API order, with a fallback for untitled profiles
+    profile_titles: list[str] = field(default_factory=list)
+    profile_by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+    selected_profile: dict[str, Any] | None = None
+    default_profile: dict[str, Any] | None = None
+    most_recent_profile: dict[str, Any] | None = None
+    most_recent_profile_ts: int | None = None
+    profile_usage_stats: dict[str, int] = field(default_factory=dict)
+    profile_usage_total: int = 0
+    most_popular_profile: str | None = None
+    # Validated last brew end timestamp and duration in seconds
+    last_brew_end_ts: int | None = None
+    last_brew_duration: int | None = None
+    # Keyed by BREW_TIME_KEYS; datetimes are immutable, so sensors share them
+    brew_datetimes: dict[str, datetime | None] = field(
+        default_factory=lambda: dict.fromkeys(BREW_TIME_KEYS)
+    )
+
+
+def _parse_brew_timestamp(value: Any) -> int | None:
+    """Return a brew timestamp from the device config, or None if invalid."""
+    if not value or value == "0":
+        return None
+    try:
+        timestamp = int(value)
+    except (ValueError, TypeError):
+        _LOGGER.error("Invalid brew timestamp: %s", value)
+        return None
+    if timestamp < TIMESTAMP_2024_01_01:  # Zero, epoch or before 2024-01-01
+        return None
+    return timestamp
+
+
+def _parse_brew_times(
+    device_config: dict[str, Any],
+) -> tuple[int | None, int | None, int | None]:
+    """Return the last brew's (start, end, duration in seconds)."""
+    start_ts = _parse_brew_timestamp(device_config.get("brewStartTime"))
+    end_ts = _parse_brew_timestamp(device_config.get("brewEndTime"))
+    duration = None
+    if start_ts is not None and end_ts is not None:
+        if end_ts < start_ts:
+            _LOGGER.warning("End time precedes start time for the last brew cycle.")
+        else:
+            duration = end_ts - start_ts
+    return start_ts, end_ts, duration
+
+
+def _brew_datetime(value: Any) -> datetime | None:
+    """Return a device config brew time as a UTC datetime, or None if invalid."""
+    if not value or value == "0":
+        return None
+    try:
+        timestamp = int(value)
+        if timestamp == 0:
+            return None
+        brew_datetime = dt_util.utc_from_timestamp(timestamp)
+    except (ValueError, TypeError, OSError, OverflowError) as error:
+        _LOGGER.error("Error parsing brew time %s: %s", value, error)
+        return None
+    if brew_datetime.year < MIN_VALID_YEAR:
+        return None
+    return brew_datetime
+
+
+def _derive_device_state(
+    device_config: dict[str, Any], profiles: list[dict[str, Any]] | None
+) -> DerivedData:
+    """Derive the profile lookups and brew times from one poll's payload."""
+    profile_titles: list[str] = []
+    profile_by_id: dict[str, dict[str, Any]] = {}
+    default_profile = None
+    most_recent_profile = None
+    most_recent_ts = 0
+    for index, profile in enumerate(profiles or []):
+        # Only format the fallback title when it is actually needed
+        profile_titles.append(profile["title"] if "title" in profile else f"Profile {index}")
+        if "id" in profile:
+            profile_by_id[profile["id"]] = profile
+        if default_profile is None and profile.get("isDefaultProfile"):
+            default_profile = profile
+        last_used = profile.get("lastUsedTime")
+        if not last_used or last_used == "0":
+            continue
+        try:
+            last_used_ts = int(last_used)
+        except (ValueError, TypeError):
+            continue
+        if last_used_ts > most_recent_ts:
+            most_recent_profile, most_recent_ts = profile, last_used_ts
+
+    selected_profile_id = device_config.get("ibSelectedProfileId")
+    _, end_ts, duration = _parse_brew_times(device_config)
+    return DerivedData(
+        profile_titles=profile_titles,
+        profile_by_id=profile_by_id,
+        selected_profile=profile_by_id.get(selected_profile_id)
+        if selected_profile_id
+        else None,
+        default_profile=default_profile,
+        most_recent_profile=most_recent_profile,
+        most_recent_profile_ts=most_recent_ts or None,
+        last_brew_end_ts=end_ts,
+        last_brew_duration=duration,
+        brew_datetimes={
+            key: _brew_datetime(device_config.get(key)) for key in BREW_TIME_KEYS
+        },
+    )
+
+
 class FellowAidenDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to fetch data from the Fellow Aiden cloud API."""
 
@@ -28,20 +157,43 @@ class FellowAidenDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.api: FellowAiden | None = None
         self.history_manager = BrewHistoryManager(hass, entry.entry_id)
         self._next_refresh_verbose = False
+        self._consecutive_failures = 0
+        # Device config of the last successful update, shared by all entities
+        self.device_config: dict[str, Any] = {}
+        # Profile lookups and brew times derived once per update
+        self.derived = DerivedData()
+        # History query results of the last update, read by the sensors
+        self.history_snapshot = HistorySnapshot()
 
         # Get update interval from options or use default
         update_interval_seconds = entry.options.get(
             "update_interval_seconds", DEFAULT_UPDATE_INTERVAL_MINUTES * 60
         )
 
+        self._base_update_interval = timedelta(seconds=update_interval_seconds)
+
         super().__init__(
             hass,
             _LOGGER,
             name="fellow_aiden_coordinator",
-            update_interval=timedelta(seconds=update_interval_seconds),
+            update_interval=self._base_update_interval,
             config_entry=entry,
         )
 
+        # Retention pruning runs on its own daily timer instead of every poll
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass,
+                self._async_prune_history,
+                timedelta(hours=HISTORY_PRUNE_INTERVAL_HOURS),
+            )
+        )
+
+    @callback
+    def _async_prune_history(self, _now: datetime) -> None:
+        """Drop history records older than the retention window."""
+        self.history_manager.async_prune_old_records()
+
     async def async_config_entry_first_refresh(self) -> None:
         """Create the async API client and perform the initial refresh."""
         session = async_get_clientsession(self.hass)
@@ -55,6 +207,32 @@ class FellowAidenDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         await super().async_config_entry_first_refresh()
 
     async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data, backing off the polling interval while the API fails."""
+        try:
+            data = await self._async_fetch_data()
+        except UpdateFailed:
+            self._consecutive_failures += 1
+            # Double per failure (exponent capped to keep timedelta in range),
+            # jitter by +/-50% so clients don't retry in lockstep, then clamp
+            backoff = self._base_update_interval * 2 ** min(self._consecutive_failures, 10)
+            backoff *= random.uniform(0.5, 1.5)
+            self.update_interval = min(
+                backoff, timedelta(minutes=MAX_FAILURE_BACKOFF_MINUTES)
+            )
+            _LOGGER.debug(
+                "Update failed %d time(s) in a row, next attempt in %s",
+                self._consecutive_failures,
+                self.update_interval,
+            )
+            raise
+
+        if self._consecutive_failures:
+            _LOGGER.debug("Update succeeded, restoring polling interval")
+            self._consecutive_failures = 0
+            self.update_interval = self._base_update_interval
+        return data
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Fetch data from the Fellow Aiden cloud API."""
         _LOGGER.debug("Starting data update cycle")
         if not self.api:
@@ -74,10 +252,12 @@ class FellowAidenDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ) from err
 
         brewer_name = self.api.get_display_name()
+        device_config = self.api.get_device_config()
         try:
-            profiles = await self.api.get_profiles()
-            device_config = self.api.get_device_config()
-            schedules = await self.api.get_schedules()
+            # Both lists depend only on the brewer ID, so fetch them concurrently
+            profiles, schedules = await asyncio.gather(
+                self.api.get_profiles(), self.api.get_schedules()
+            )
         except FellowAuthError as err:
             raise ConfigEntryAuthFailed(
                 f"Authentication failed: {err}"
@@ -97,7 +277,7 @@ class FellowAidenDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.info("Device config: %s", device_config)
             _LOGGER.info("Schedules (%d): %s", len(schedules) if schedules else 0, schedules)
             _LOGGER.info("=== End API Response ===")
-        else:
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Polled: %d profiles, %d schedules, device: %s",
                 len(profiles) if profiles else 0,
@@ -115,22 +295,29 @@ class FellowAidenDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "device_config": device_config,
             "schedules": schedules,
         }
-        _LOGGER.debug(
-            "Returning data: %d profiles, %d schedules",
-            len(profiles) if profiles else 0, len(schedules) if schedules else 0,
-        )
+        self.device_config = device_config
+        derived = _derive_device_state(device_config, profiles)
 
         # Update historical data with the new data (non-fatal)
         _LOGGER.debug("Updating historical data")
+        # New brews are attributed to the default profile, or the first one
+        brew_profile = derived.default_profile or (profiles[0] if profiles else None)
         try:
-            await self.history_manager.async_update_data(device_config, profiles)
+            await self.history_manager.async_update_data(device_config, brew_profile)
         except Exception:
             _LOGGER.warning("Failed to update historical data", exc_info=True)
+        self.history_snapshot = self.history_manager.snapshot()
+        # Taken after the history update, so the usage stats include this poll's brews
+        self.derived = replace(
+            derived,
+            profile_usage_stats=self.history_manager.get_profile_usage_stats(),
+            profile_usage_total=self.history_manager.profile_usage_total,
+            most_popular_profile=self.history_manager.get_most_popular_profile(),
+        )
 
         _LOGGER.debug("Data update completed successfully")
         return result
 
-
     async def async_create_profile(self, profile_data: dict[str, Any]) -> None:
         """Create a new brew profile and refresh coordinator data."""
         if not self.api:
@@ -8,13 +8,13 @@ from homeassistant.core import HomeAssistant
 
 from .const import FellowAidenConfigEntry
 
-TO_REDACT_CONFIG = {"email", "password"}
-TO_REDACT_DEVICE = {
+TO_REDACT_CONFIG = frozenset({"email", "password"})
+TO_REDACT_DEVICE = frozenset({
     "wifiMacAddress",
     "btMacAddress",
     "wifiSSID",
     "localIpAddress",
-}
+})
 
 
 async def async_get_config_entry_diagnostics(
@@ -22,10 +22,10 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator = entry.runtime_data
-    data = coordinator.data or {}
+    data = coordinator.data
 
-    return {
-        "entry_data": async_redact_data(dict(entry.data), TO_REDACT_CONFIG),
+    diagnostics: dict[str, Any] = {
+        "entry_data": async_redact_data(entry.data, TO_REDACT_CONFIG),
         "options": dict(entry.options),
         "coordinator": {
             "last_update_success": coordinator.last_update_success,
@@ -33,10 +33,15 @@ async def async_get_config_entry_diagnostics(
             if coordinator.update_interval
             else None,
         },
-        "device_config": async_redact_data(
-            data.get("device_config", {}), TO_REDACT_DEVICE
-        ),
-        "profiles_count": len(data.get("profiles", [])),
-        "schedules_count": len(data.get("schedules", [])),
-        "brewer_name": data.get("brewer_name"),
     }
+    if not data:
+        # No successful refresh yet; there is no device payload to redact
+        return diagnostics
+
+    diagnostics["device_config"] = async_redact_data(
+        data.get("device_config", {}), TO_REDACT_DEVICE
+    )
+    diagnostics["profiles_count"] = len(data.get("profiles", []))
+    diagnostics["schedules_count"] = len(data.get("schedules", []))
+    diagnostics["brewer_name"] = data.get("brewer_name")
+    return diagnostics
@@ -8,14 +8,17 @@ from difflib import SequenceMatcher
 from typing import Any
 
 import aiohttp
+import orjson
 from pydantic import ValidationError
 
 from .profile import CoffeeProfile
 from .schedule import CoffeeSchedule
 
+# Shared brew link ("https://.../p/<id>/") or a bare profile ID
+BREWLINK_REGEX = re.compile(r"(?:.*?/p/)?([a-zA-Z0-9]+)/?$")
 
-def similar(a: str, b: str) -> float:
-    return SequenceMatcher(None, a, b).ratio()
+# Minimum SequenceMatcher ratio for a fuzzy title match
+FUZZY_MATCH_THRESHOLD = 0.65
 
 
 class FellowAuthError(Exception):
@@ -45,7 +48,7 @@ class FellowAiden:
     HEADERS = {
         "User-Agent": "Fellow/5 CFNetwork/1568.300.101 Darwin/24.2.0",
     }
-    SERVER_SIDE_PROFILE_FIELDS = [
+    SERVER_SIDE_PROFILE_FIELDS = frozenset({
         "id",
         "createdAt",
         "deletedAt",
@@ -56,7 +59,7 @@ class FellowAiden:
         "folder",
         "duration",
         "lastGBQuantity",
-    ]
+    })
 
     _RETRY_STATUSES = frozenset({408, 500, 501, 502, 503, 504})
     _MAX_RETRIES = 3
@@ -75,6 +78,11 @@ class FellowAiden:
         self._brewer_id: str | None = None
         self._profiles: list[dict[str, Any]] | None = None
         self._schedules: list[dict[str, Any]] | None = None
+        # ID lookups, rebuilt whenever the lists above are re-fetched
+        self._profile_index: dict[str, dict[str, Any]] = {}
+        self._schedule_index: dict[str, dict[str, Any]] = {}
+        # URL -> (ETag, parsed body) for conditional GETs
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
         self._session = session
 
     # -- HTTP helpers -------------------------------------------------------
@@ -92,10 +100,13 @@ class FellowAiden:
         url: str,
         *,
         authenticated: bool = True,
+        extra_headers: dict[str, str] | None = None,
         **kwargs: Any,
     ) -> aiohttp.ClientResponse:
         """HTTP request with automatic retries on server errors."""
         headers = self._build_headers(authenticated)
+        if extra_headers:
+            headers.update(extra_headers)
 
         response: aiohttp.ClientResponse | None = None
         for attempt in range(self._MAX_RETRIES + 1):
@@ -154,13 +165,38 @@ class FellowAiden:
         self, response: aiohttp.ClientResponse
     ) -> Any:
         """Parse a response body as JSON, falling back to raw text."""
+        body = await response.read()
+        if not body.strip():
+            return None
         try:
-            return await response.json(content_type=None)
-        except (ValueError, aiohttp.ContentTypeError):
-            text = (await response.text()).strip()
-            if text:
-                return {"raw": text}
-            return {}
+            # Decode straight from bytes, skipping the intermediate str
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return {"raw": (await response.text()).strip()}
+
+    async def _get_json(self, url: str, action: str, **kwargs: Any) -> Any:
+        """GET a JSON resource, revalidating the cached copy via its ETag.
+
+        A 304 reply has no body, so the previously parsed payload is returned
+        as-is and the unchanged JSON is neither transferred nor decoded again.
+        """
+        cached = self._etag_cache.get(url)
+        extra_headers = {"If-None-Match": cached[0]} if cached else None
+        response = await self._request_with_reauth(
+            "get", url, extra_headers=extra_headers, **kwargs
+        )
+        if response.status == 304 and cached is not None:
+            response.release()
+            return cached[1]
+        await self._ensure_success(response, action)
+
+        parsed = await self._parse_response(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[url] = (etag, parsed)
+        else:
+            self._etag_cache.pop(url, None)
+        return parsed
 
     async def _ensure_success(
         self, response: aiohttp.ClientResponse, action: str
@@ -239,12 +275,9 @@ class FellowAiden:
         """Fetch device info from the API."""
         self._log.debug("Fetching device for account")
         device_url = self.BASE_URL + self.API_DEVICES
-        response = await self._request_with_reauth(
-            "get", device_url, params={"dataType": "real"}
+        parsed = await self._get_json(
+            device_url, "Device fetch", params={"dataType": "real"}
         )
-        await self._ensure_success(response, "Device fetch")
-
-        parsed = await self._parse_response(response)
         self._log.debug(parsed)
         if not isinstance(parsed, list):
             raise Exception(f"Unexpected device response payload: {parsed}")
@@ -280,15 +313,13 @@ class FellowAiden:
             profiles_url = self.BASE_URL + self.API_PROFILES.format(
                 id=self._brewer_id
             )
-            response = await self._request_with_reauth("get", profiles_url)
-            await self._ensure_success(response, "Profile fetch")
-
-            parsed = await self._parse_response(response)
+            parsed = await self._get_json(profiles_url, "Profile fetch")
             if not isinstance(parsed, list):
                 raise Exception(f"Unexpected profiles response payload: {parsed}")
 
             self._log.debug(parsed)
             self._profiles = parsed
+            self._profile_index = {p["id"]: p for p in parsed if "id" in p}
         return self._profiles
 
     async def get_schedules(self) -> list[dict[str, Any]]:
@@ -298,15 +329,13 @@ class FellowAiden:
             schedules_url = self.BASE_URL + self.API_SCHEDULES.format(
                 id=self._brewer_id
             )
-            response = await self._request_with_reauth("get", schedules_url)
-            await self._ensure_success(response, "Schedule fetch")
-
-            parsed = await self._parse_response(response)
+            parsed = await self._get_json(schedules_url, "Schedule fetch")
             if not isinstance(parsed, list):
                 raise Exception(f"Unexpected schedules response payload: {parsed}")
 
             self._log.debug(parsed)
             self._schedules = parsed
+            self._schedule_index = {str(s["id"]): s for s in parsed if "id" in s}
         return self._schedules
 
     def get_device_config(self) -> dict[str, Any] | None:
@@ -332,18 +361,18 @@ class FellowAiden:
 
     async def _is_valid_profile_id(self, pid: str) -> bool:
         """Check if a profile ID is valid."""
-        profiles = await self.get_profiles()
-        return any(pid == p["id"] for p in profiles)
+        await self.get_profiles()
+        return pid in self._profile_index
 
     async def _get_schedule_ids(self) -> list[str]:
         """Return a list of schedule IDs."""
-        schedules = await self.get_schedules()
-        return [str(s["id"]) for s in schedules]
+        await self.get_schedules()
+        return list(self._schedule_index)
 
     async def _is_valid_schedule_id(self, sid: str) -> bool:
         """Check if a schedule ID is valid."""
-        schedules = await self.get_schedules()
-        return any(sid == str(s["id"]) for s in schedules)
+        await self.get_schedules()
+        return sid in self._schedule_index
 
     # -- Profile operations -------------------------------------------------
 
@@ -352,18 +381,28 @@ class FellowAiden:
     ) -> dict[str, Any] | None:
         """Find a profile by title."""
         profiles = await self.get_profiles()
+        wanted = title.lower()
+        # SequenceMatcher caches its analysis of seq2, so the searched title
+        # is prepared once; the cheap upper bounds skip most full ratio() runs
+        matcher = SequenceMatcher(None, b=wanted)
         for profile in profiles:
-            if fuzzy and similar(profile["title"].lower(), title.lower()) > 0.65:
-                return profile
-            if profile["title"].lower() == title.lower():
+            candidate = profile["title"].lower()
+            if candidate == wanted:
                 return profile
+            if fuzzy:
+                matcher.set_seq1(candidate)
+                if (
+                    matcher.real_quick_ratio() > FUZZY_MATCH_THRESHOLD
+                    and matcher.quick_ratio() > FUZZY_MATCH_THRESHOLD
+                    and matcher.ratio() > FUZZY_MATCH_THRESHOLD
+                ):
+                    return profile
         return None
 
     async def parse_brewlink_url(self, link: str) -> dict[str, Any]:
         """Extract profile information from a shared brew link."""
         self._log.debug("Parsing shared brew link")
-        pattern = r"(?:.*?/p/)?([a-zA-Z0-9]+)/?$"
-        match = re.search(pattern, link)
+        match = BREWLINK_REGEX.search(link)
         if not match:
             raise ValueError("Invalid profile URL or ID format")
         brew_id = match.group(1)
@@ -383,8 +422,8 @@ class FellowAiden:
                 f"Unexpected shared profile payload for ID {brew_id}: {parsed}"
             )
 
-        for field in self.SERVER_SIDE_PROFILE_FIELDS:
-            parsed.pop(field, None)
+        for field in parsed.keys() & self.SERVER_SIDE_PROFILE_FIELDS:
+            del parsed[field]
         self._log.debug("Profile fetched: %s", parsed)
         return parsed
 
@@ -413,7 +452,11 @@ class FellowAiden:
         if "id" not in parsed:
             raise Exception(f"Error in processing: {parsed}")
 
-        await self._fetch_device()
+        # The response is the new profile; extend the cached list instead of
+        # re-fetching the device. A new list keeps earlier snapshots intact.
+        if self._profiles is not None:
+            self._profiles = [*self._profiles, parsed]
+            self._profile_index[parsed["id"]] = parsed
         self._log.debug("Brew profile created: %s", parsed)
         return parsed
 
@@ -434,8 +477,8 @@ class FellowAiden:
                 f"Profile with ID {profile_id} does not exist. Valid profiles: {ids}"
             )
 
-        for field in self.SERVER_SIDE_PROFILE_FIELDS:
-            data.pop(field, None)
+        for field in data.keys() & self.SERVER_SIDE_PROFILE_FIELDS:
+            del data[field]
 
         update_url = self.BASE_URL + self.API_PROFILE.format(
             id=self._brewer_id, pid=profile_id
@@ -444,7 +487,7 @@ class FellowAiden:
         response = await self._request_with_reauth("patch", update_url, json=data)
         await self._ensure_success(response, f"Profile update ({profile_id})")
 
-        await self._fetch_device()
+        self._profiles = None
         self._log.debug("Profile %s updated successfully", profile_id)
         return True
 
@@ -480,7 +523,9 @@ class FellowAiden:
         self._log.debug(delete_url)
         response = await self._request_with_reauth("delete", delete_url)
         await self._ensure_success(response, f"Profile deletion ({pid})")
-        self._profiles = None
+        if self._profiles is not None:
+            self._profiles = [p for p in self._profiles if p.get("id") != pid]
+            self._profile_index.pop(pid, None)
 
         self._log.debug("Profile deleted")
         return True
@@ -522,7 +567,9 @@ class FellowAiden:
                 message += f" Valid profiles: {ids}"
             raise Exception(f"Error in processing: {message}")
 
-        await self._fetch_device()
+        if self._schedules is not None:
+            self._schedules = [*self._schedules, parsed]
+            self._schedule_index[str(parsed["id"])] = parsed
         self._log.debug("Brew schedule created: %s", parsed)
         return parsed
 
@@ -540,7 +587,11 @@ class FellowAiden:
         self._log.debug(delete_url)
         response = await self._request_with_reauth("delete", delete_url)
         await self._ensure_success(response, f"Schedule deletion ({sid})")
-        self._schedules = None
+        if self._schedules is not None:
+            self._schedules = [
+                s for s in self._schedules if "id" not in s or str(s["id"]) != sid
+            ]
+            self._schedule_index.pop(sid, None)
 
         self._log.debug("Schedule deleted")
         return True
@@ -1,44 +1,21 @@
 """Model to validate the coffee schedule data"""
-from pydantic import BaseModel, field_validator
+from typing import Annotated
+
+from pydantic import BaseModel, Field
 import re
 from ..const import MIN_WATER_AMOUNT_ML, MAX_WATER_AMOUNT_ML
 
 # Regular expression for profileId: either "p" followed by digits or "plocal" followed by digits
 PROFILE_ID_REGEX = re.compile(r'^(p|plocal)\d+$')
 
+# Constraints are declared on the fields so pydantic-core checks them natively
+# instead of calling back into Python validators
 class CoffeeSchedule(BaseModel):
-    days: list[bool]
-    secondFromStartOfTheDay: int
+    # 7 boolean values, from Sunday to Saturday
+    days: Annotated[list[bool], Field(min_length=7, max_length=7)]
+    # 0 to 86399 (seconds in a day)
+    secondFromStartOfTheDay: Annotated[int, Field(ge=0, lt=86400)]
     enabled: bool
-    amountOfWater: int
-    profileId: str
-
-    @field_validator('days')
-    @classmethod
-    def validate_days(cls, v):
-        if len(v) != 7:
-            raise ValueError("The 'days' list must contain exactly 7 boolean values (from Sunday to Saturday).")
-        if any(not isinstance(day, bool) for day in v):
-            raise ValueError("Each element in 'days' must be a boolean.")
-        return v
-
-    @field_validator('secondFromStartOfTheDay')
-    @classmethod
-    def validate_second_from_start_of_the_day(cls, v):
-        if not (0 <= v < 86400):
-            raise ValueError("secondFromStartOfTheDay must be between 0 and 86399 (seconds in a day).")
-        return v
-
-    @field_validator('amountOfWater')
-    @classmethod
-    def validate_amount_of_water(cls, v):
-        if not (MIN_WATER_AMOUNT_ML <= v <= MAX_WATER_AMOUNT_ML):
-            raise ValueError(f"amountOfWater must be between {MIN_WATER_AMOUNT_ML} and {MAX_WATER_AMOUNT_ML}.")
-        return v
-
-    @field_validator('profileId')
-    @classmethod
-    def validate_profile_id(cls, v):
-        if not PROFILE_ID_REGEX.match(v):
-            raise ValueError("profileId must be either 'p' followed by a number or 'plocal' followed by a number.")
-        return v
\ No newline at end of file
+    amountOfWater: Annotated[int, Field(ge=MIN_WATER_AMOUNT_ML, le=MAX_WATER_AMOUNT_ML)]
+    # "p" or "plocal" followed by a number
+    profileId: Annotated[str, Field(pattern=PROFILE_ID_REGEX.pattern)]
@@ -1,6 +1,8 @@
 """Select entity to list brew profiles from Fellow Aiden."""
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -9,7 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, FellowAidenConfigEntry
 from .coordinator import FellowAidenDataUpdateCoordinator
-from .base_entity import FellowAidenBaseEntity
+from .base_entity import FellowAidenComputedEntity
 
 PARALLEL_UPDATES = 0
 
@@ -21,10 +23,10 @@ async def async_setup_entry(
 ) -> None:
     """Set up select entity listing all brew profiles."""
     coordinator = entry.runtime_data
-    async_add_entities([FellowAidenProfilesSelect(coordinator, entry)], update_before_add=True)
+    async_add_entities([FellowAidenProfilesSelect(coordinator, entry)])
 
 
-class FellowAidenProfilesSelect(FellowAidenBaseEntity, SelectEntity):
+class FellowAidenProfilesSelect(FellowAidenComputedEntity, SelectEntity):
     """Dropdown showing available brew profiles.
 
     Selecting a profile from the UI is not supported by the Fellow API;
@@ -37,41 +39,34 @@ class FellowAidenProfilesSelect(FellowAidenBaseEntity, SelectEntity):
         self._entry_id = entry.entry_id
         self._attr_unique_id = f"{entry.entry_id}-profile_select"
         self._attr_translation_key = "profiles"
+        # Options are part of the capabilities registered before the entity is added
+        self._update_from_coordinator()
+
+    def _update_from_coordinator(self) -> None:
+        """Take the options and the current option from the coordinator's derived data."""
+        self._attr_options = self.coordinator.derived.profile_titles
+        self._attr_current_option = self._resolve_current_option()
 
-    @property
-    def options(self) -> list[str]:
-        """Return profile titles."""
-        data = self.coordinator.data
-        if not data or "profiles" not in data:
-            return []
-        return [p.get("title", f"Profile {i}") for i, p in enumerate(data["profiles"])]
+    def _state_values(self) -> tuple[Any, ...]:
+        """Return the options list and the current option."""
+        return (self._attr_options, self._attr_current_option)
 
-    @property
-    def current_option(self) -> str | None:
+    def _resolve_current_option(self) -> str | None:
         """Return the active profile, or the default, or the first one."""
-        data = self.coordinator.data
-        if not data or "profiles" not in data or not data["profiles"]:
+        coordinator = self.coordinator
+        derived = coordinator.derived
+        if not derived.profile_titles:
             return None
 
-        device_config = self.coordinator.data.get("device_config")
-        if device_config:
-            selected_profile_id = device_config.get("ibSelectedProfileId")
-            if selected_profile_id:
-                selected_profile = next(
-                    (p for p in data["profiles"] if p.get("id") == selected_profile_id),
-                    None,
-                )
-                if selected_profile:
-                    return selected_profile.get("title", "Selected Profile")
-
-        default_profile = next(
-            (p for p in data["profiles"] if p.get("isDefaultProfile")),
-            None,
-        )
+        selected_profile = derived.selected_profile
+        if selected_profile:
+            return selected_profile.get("title", "Selected Profile")
+
+        default_profile = derived.default_profile
         if default_profile:
             return default_profile.get("title", "Default Profile")
 
-        return data["profiles"][0].get("title", "Profile 1")
+        return coordinator.data["profiles"][0].get("title", "Profile 1")
 
     async def async_select_option(self, option: str) -> None:
         """Raise error — the Fellow API doesn't support switching profiles remotely."""
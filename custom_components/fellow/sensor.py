@@ -1,4 +1,5 @@
 import logging
+from abc import abstractmethod
 from typing import Any
 from datetime import datetime
 
@@ -14,27 +15,34 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, TIMESTAMP_2024_01_01, MIN_VALID_YEAR, MIN_HISTORICAL_DATA_FOR_ACCURACY, FellowAidenConfigEntry
+from .const import DOMAIN, MIN_HISTORICAL_DATA_FOR_ACCURACY, FellowAidenConfigEntry
 from .coordinator import FellowAidenDataUpdateCoordinator
-from .base_entity import FellowAidenBaseEntity
+from .base_entity import FellowAidenBaseEntity, FellowAidenComputedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 0
 
 # Standard sensors: (api_key, translation_key, unit, device_class, state_class, entity_category, disabled_default)
-STANDARD_SENSORS = [
+STANDARD_SENSORS = (
     ("chimeVolume", "chime_volume", None, None, None, EntityCategory.DIAGNOSTIC, True),
     ("totalBrewingCycles", "total_brews", None, None, SensorStateClass.TOTAL_INCREASING, None, False),
     ("totalWaterVolumeL", "total_water_volume", UnitOfVolume.LITERS, SensorDeviceClass.VOLUME, SensorStateClass.TOTAL_INCREASING, None, False),
     ("brewingWaterVolumeMl", "last_brew_volume", UnitOfVolume.MILLILITERS, SensorDeviceClass.VOLUME, None, None, False),
-]
+)
 
 # Brew time sensors: (api_key, translation_key)
-BREW_TIME_SENSORS = [
+BREW_TIME_SENSORS = (
     ("brewStartTime", "last_brew_start_time"),
     ("brewEndTime", "last_brew_end_time"),
-]
+)
+
+# Water period sensors: (days, translation_key, unique_id_suffix, brew_count_attribute)
+WATER_PERIOD_SENSORS = (
+    (1, "total_water_today", "total_water_today", None),
+    (7, "total_water_this_week", "total_water_week", "brews_this_week"),
+    (30, "total_water_this_month", "total_water_month", "brews_this_month"),
+)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -45,118 +53,155 @@ async def async_setup_entry(
     _LOGGER.debug("Setting up sensors for entry %s", entry.entry_id)
     coordinator = entry.runtime_data
 
-    _LOGGER.debug("Coordinator data available: %s", coordinator.data is not None)
-    if coordinator.data:
-        _LOGGER.debug("Coordinator data keys: %s", list(coordinator.data.keys()))
-
-    entities: list[SensorEntity] = []
-
-    # Standard sensors from device config
-    for key, translation_key, unit, device_class, state_class, category, disabled in STANDARD_SENSORS:
-        entities.append(
-            AidenSensor(
-                coordinator=coordinator,
-                entry=entry,
-                key=key,
-                translation_key=translation_key,
-                unit=unit,
-                device_class=device_class,
-                state_class=state_class,
-                entity_category=category,
-                disabled_default=disabled,
-            )
-        )
-
-    # Initialize derived sensor: Average Water per Brew
-    entities.append(
-        AidenAverageWaterPerBrewSensor(
-            coordinator=coordinator,
-            entry=entry
-        )
-    )
-
-    # Brew time sensors
-    for key, translation_key in BREW_TIME_SENSORS:
-        entities.append(
-            AidenBrewTimeSensor(
-                coordinator=coordinator,
-                entry=entry,
-                key=key,
-                translation_key=translation_key,
-            )
-        )
-
-    # Initialize the Last Brew Duration sensor immediately after brew time sensors
-    entities.append(
-        AidenLastBrewDurationSensor(
-            coordinator=coordinator,
-            entry=entry
-        )
-    )
-
-    # Analytics sensors
-    entities.extend([
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Coordinator data available: %s", coordinator.data is not None)
+        if coordinator.data:
+            _LOGGER.debug("Coordinator data keys: %s", list(coordinator.data))
+
+    entities: list[SensorEntity] = [
+        # Standard sensors from device config
+        *(cls(coordinator, entry) for cls in STANDARD_SENSOR_CLASSES),
+        # Derived sensor: Average Water per Brew
+        AidenAverageWaterPerBrewSensor(coordinator, entry),
+        # Brew time sensors
+        *(
+            AidenBrewTimeSensor(coordinator, entry, key, translation_key)
+            for key, translation_key in BREW_TIME_SENSORS
+        ),
+        # Last Brew Duration sensor immediately after the brew time sensors
+        AidenLastBrewDurationSensor(coordinator, entry),
+        # Analytics sensors
         AidenAverageTimeBetweenBrewsSensor(coordinator, entry),
         AidenLastBrewTimeSensor(coordinator, entry),
-        AidenTotalWaterTodaySensor(coordinator, entry),
-        AidenTotalWaterWeekSensor(coordinator, entry),
-        AidenTotalWaterMonthSensor(coordinator, entry),
+        *(
+            AidenTotalWaterPeriodSensor(coordinator, entry, *period)
+            for period in WATER_PERIOD_SENSORS
+        ),
         AidenAverageBrewDurationSensor(coordinator, entry),
         AidenMostPopularProfileSensor(coordinator, entry),
         AidenCurrentProfileSensor(coordinator, entry),
         AidenBasketSensor(coordinator, entry),
-    ])
+    ]
 
     _LOGGER.debug("Adding %d sensor entities", len(entities))
-    async_add_entities(entities, update_before_add=True)
+    # The coordinator has already refreshed, so the entities have data when added
+    async_add_entities(entities)
     _LOGGER.info("Successfully set up %d sensors for Fellow Aiden", len(entities))
 
 
-class AidenSensor(FellowAidenBaseEntity, SensorEntity):
-    """Sensor for a value read directly from the device config."""
+class AidenCachedAttributesSensor(FellowAidenBaseEntity, SensorEntity):
+    """Base for sensors whose attributes only change with coordinator data.
 
-    def __init__(
-        self,
-        coordinator: FellowAidenDataUpdateCoordinator,
-        entry: ConfigEntry,
-        key: str,
-        translation_key: str,
-        unit: str | None,
-        device_class: SensorDeviceClass | None = None,
-        state_class: SensorStateClass | None = None,
-        entity_category: EntityCategory | None = None,
-        disabled_default: bool = False,
-    ) -> None:
+    The attributes dict is rebuilt once per coordinator update and reused
+    for every read until the next one; HA treats it as read-only.
+    """
+
+    def __init__(self, coordinator: FellowAidenDataUpdateCoordinator) -> None:
         super().__init__(coordinator)
-        self._entry_id = entry.entry_id
-        self._key = key
-        self._attr_translation_key = translation_key
-        self._attr_unique_id = f"{entry.entry_id}-{key}"
-        self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-        self._attr_entity_category = entity_category
-        self._attr_entity_registry_enabled_default = not disabled_default
+        self._attrs: dict[str, Any] | None = None
+        self._attrs_source: dict[str, Any] | None = None
+
+    @abstractmethod
+    def _build_attributes(self) -> dict[str, Any]:
+        """Return the sensor's additional attributes."""
 
     @property
-    def native_value(self) -> Any:
-        """Retrieve and process the sensor's value."""
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the attributes built for the current coordinator data."""
         data = self.coordinator.data
-        if not data:
+        attrs = self._attrs
+        if attrs is None or self._attrs_source is not data:
+            attrs = self._attrs = self._build_attributes()
+            self._attrs_source = data
+        return attrs
+
+
+class AidenComputedSensor(FellowAidenComputedEntity, SensorEntity):
+    """Base for sensors whose state only depends on coordinator data.
+
+    The value is computed once when the entity is added and once per
+    coordinator update, and HA reads it from _attr_native_value.
+    """
+
+    @abstractmethod
+    def _compute_native_value(self) -> Any:
+        """Return the sensor's value for the current coordinator data."""
+
+    def _update_from_coordinator(self) -> None:
+        """Store the value for the current coordinator data."""
+        self._attr_native_value = self._compute_native_value()
+
+    def _state_values(self) -> tuple[Any, ...]:
+        """Return the computed value."""
+        return (self._attr_native_value,)
+
+
+class AidenSensor(AidenComputedSensor):
+    """Sensor for a value read directly from the device config.
+
+    Each STANDARD_SENSORS row gets its own subclass (see
+    _standard_sensor_class), so the per-key description lives on the class.
+    """
+
+    _key: str
+
+    def __init__(self, coordinator: FellowAidenDataUpdateCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+        self._entry_id = entry.entry_id
+        self._attr_unique_id = f"{entry.entry_id}-{self._key}"
+
+    def _compute_native_value(self) -> Any:
+        """Retrieve the sensor's value."""
+        return self.coordinator.device_config.get(self._key)
+
+
+class AidenTotalWaterVolumeSensor(AidenSensor):
+    """Total water volume, converted to liters."""
+
+    def _compute_native_value(self) -> float | None:
+        """Retrieve the total water volume in liters."""
+        value = self.coordinator.device_config.get(self._key)
+        if value is None:
             return None
-        device_config = data.get("device_config", {})
-        value = device_config.get(self._key)
+        return round(value / 1000.0, 2)  # API field is misnamed; value is in mL
 
-        # Apply unit conversion for water volume if applicable
-        if self._key == "totalWaterVolumeL" and value is not None:
-            return round(value / 1000.0, 2)  # API field is misnamed; value is in mL
 
-        return value
+def _standard_sensor_class(
+    key: str,
+    translation_key: str,
+    unit: str | None,
+    device_class: SensorDeviceClass | None,
+    state_class: SensorStateClass | None,
+    entity_category: EntityCategory | None,
+    disabled_default: bool,
+) -> type[AidenSensor]:
+    """Build the AidenSensor subclass for one STANDARD_SENSORS row."""
+    base = AidenTotalWaterVolumeSensor if key == "totalWaterVolumeL" else AidenSensor
+
+    class StandardSensor(base):
+        _key = key
+        _attr_translation_key = translation_key
+        _attr_native_unit_of_measurement = unit
+        _attr_device_class = device_class
+        _attr_state_class = state_class
+        _attr_entity_category = entity_category
+        _attr_entity_registry_enabled_default = not disabled_default
+
+    StandardSensor.__name__ = StandardSensor.__qualname__ = f"AidenSensor_{key}"
+    return StandardSensor
 
 
-class AidenAverageWaterPerBrewSensor(FellowAidenBaseEntity, SensorEntity):
+# Built once at import; instances only carry their unique ID
+STANDARD_SENSOR_CLASSES = tuple(_standard_sensor_class(*row) for row in STANDARD_SENSORS)
+
+
+class AidenAverageWaterPerBrewSensor(AidenComputedSensor):
     """Average water usage per brew: totalWaterVolume / totalBrewingCycles."""
 
+    _attr_translation_key = "average_water_per_brew"
+    _attr_native_unit_of_measurement = UnitOfVolume.MILLILITERS
+    _attr_device_class = SensorDeviceClass.VOLUME
+
     def __init__(
         self,
         coordinator: FellowAidenDataUpdateCoordinator,
@@ -164,16 +209,11 @@ class AidenAverageWaterPerBrewSensor(FellowAidenBaseEntity, SensorEntity):
     ) -> None:
         super().__init__(coordinator)
         self._entry_id = entry.entry_id
-        self._attr_translation_key = "average_water_per_brew"
         self._attr_unique_id = f"{entry.entry_id}-avg_water_per_brew"
-        self._attr_native_unit_of_measurement = UnitOfVolume.MILLILITERS
-        self._attr_device_class = SensorDeviceClass.VOLUME
 
-    @property
-    def native_value(self) -> float | None:
+    def _compute_native_value(self) -> float | None:
         """Compute and return the average water volume per brew."""
-        data = self.coordinator.data or {}
-        device_config = data.get("device_config", {})
+        device_config = self.coordinator.device_config
         total_water_ml = device_config.get("totalWaterVolumeL")
         total_brews = device_config.get("totalBrewingCycles")
 
@@ -185,9 +225,11 @@ class AidenAverageWaterPerBrewSensor(FellowAidenBaseEntity, SensorEntity):
         return round(average_ml)
 
 
-class AidenBrewTimeSensor(FellowAidenBaseEntity, SensorEntity):
+class AidenBrewTimeSensor(AidenComputedSensor):
     """Displays a brew start or end time, converted from a Unix timestamp."""
 
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
     def __init__(
         self,
         coordinator: FellowAidenDataUpdateCoordinator,
@@ -200,34 +242,20 @@ class AidenBrewTimeSensor(FellowAidenBaseEntity, SensorEntity):
         self._key = key
         self._attr_translation_key = translation_key
         self._attr_unique_id = f"{entry.entry_id}-{key}"
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
 
-    @property
-    def native_value(self) -> datetime | None:
+    def _compute_native_value(self) -> datetime | None:
         """Return the brew time as a timezone-aware datetime."""
-        data = self.coordinator.data or {}
-        device_config = data.get("device_config", {})
-        timestamp_str = device_config.get(self._key)
-
-        if not timestamp_str or timestamp_str == "0":
-            return None
-
-        try:
-            timestamp_int = int(timestamp_str)
-            if timestamp_int == 0:
-                return None
-            brew_datetime = dt_util.utc_from_timestamp(timestamp_int)
-            if brew_datetime.year < MIN_VALID_YEAR:
-                return None
-            return brew_datetime
-        except (ValueError, TypeError, OSError, OverflowError) as error:
-            _LOGGER.error("Error parsing %s: %s", self._key, error)
-            return None
+        return self.coordinator.derived.brew_datetimes[self._key]
 
 
-class AidenLastBrewDurationSensor(FellowAidenBaseEntity, SensorEntity):
+class AidenLastBrewDurationSensor(AidenComputedSensor):
     """Duration of the last brew, derived from end minus start timestamps."""
 
+    _attr_translation_key = "last_brew_duration"
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(
         self,
         coordinator: FellowAidenDataUpdateCoordinator,
@@ -235,51 +263,24 @@ class AidenLastBrewDurationSensor(FellowAidenBaseEntity, SensorEntity):
     ) -> None:
         super().__init__(coordinator)
         self._entry_id = entry.entry_id
-        self._attr_translation_key = "last_brew_duration"
         self._attr_unique_id = f"{entry.entry_id}-last_brew_duration"
-        self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
-        self._attr_device_class = SensorDeviceClass.DURATION
 
-    @property
-    def native_value(self) -> int | None:
+    def _compute_native_value(self) -> int | None:
         """Compute and return the duration of the last brew cycle."""
-        data = self.coordinator.data
-        if not data:
-            return None
-        device_config = data.get("device_config", {})
-        start_time_str = device_config.get("brewStartTime")
-        end_time_str = device_config.get("brewEndTime")
-
-        if not start_time_str or not end_time_str:
-            return None
-
-        try:
-            start_timestamp = int(start_time_str)
-            end_timestamp = int(end_time_str)
-
-            # Validate timestamps to avoid negative durations or epoch times
-            if start_timestamp == 0 or end_timestamp == 0:
-                return None
-            if start_timestamp < TIMESTAMP_2024_01_01:  # Timestamp before 2024-01-01
-                return None
-            if end_timestamp < TIMESTAMP_2024_01_01:
-                return None
-
-            duration = end_timestamp - start_timestamp
+        # Validated once per update by the coordinator
+        return self.coordinator.derived.last_brew_duration
 
-            if duration < 0:
-                _LOGGER.warning("End time precedes start time for the last brew cycle.")
-                return None
 
-            return duration
-        except (ValueError, TypeError) as error:
-            _LOGGER.error("Error calculating brew duration: %s", error)
-            return None
-
-
-class AidenAverageTimeBetweenBrewsSensor(FellowAidenBaseEntity, SensorEntity):
+class AidenAverageTimeBetweenBrewsSensor(AidenCachedAttributesSensor):
     """Rough estimate of average time between brews, from historical data."""
 
+    _attr_translation_key = "average_time_between_brews"
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
     def __init__(
         self,
         coordinator: FellowAidenDataUpdateCoordinator,
@@ -287,22 +288,16 @@ class AidenAverageTimeBetweenBrewsSensor(FellowAidenBaseEntity, SensorEntity):
     ) -> None:
         super().__init__(coordinator)
         self._entry_id = entry.entry_id
-        self._attr_translation_key = "average_time_between_brews"
         self._attr_unique_id = f"{entry.entry_id}-avg_time_between_brews"
-        self._attr_native_unit_of_measurement = UnitOfTime.HOURS
-        self._attr_device_class = SensorDeviceClass.DURATION
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_entity_registry_enabled_default = False
 
     @property
     def native_value(self) -> float | None:
         """Calculate average time between brews using historical data."""
-        return self.coordinator.history_manager.get_average_time_between_brews()
+        return self.coordinator.history_snapshot.average_time_between_brews
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        history_count = self.coordinator.history_manager.get_brew_history_count()
+        history_count = self.coordinator.history_snapshot.brew_history_count
         return {
             "historical_brews": history_count,
             "accuracy": "High - based on actual historical data" if history_count >= MIN_HISTORICAL_DATA_FOR_ACCURACY else "Low - insufficient historical data",
@@ -310,9 +305,12 @@ class AidenAverageTimeBetweenBrewsSensor(FellowAidenBaseEntity, SensorEntity):
         }
 
 
-class AidenLastBrewTimeSensor(FellowAidenBaseEntity, SensorEntity):
+class AidenLastBrewTimeSensor(AidenComputedSensor):
     """When the last brew finished (timestamp)."""
 
+    _attr_translation_key = "last_brew_time"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
     def __init__(
         self,
         coordinator: FellowAidenDataUpdateCoordinator,
@@ -320,15 +318,13 @@ class AidenLastBrewTimeSensor(FellowAidenBaseEntity, SensorEntity):
     ) -> None:
         super().__init__(coordinator)
         self._entry_id = entry.entry_id
-        self._attr_translation_key = "last_brew_time"
         self._attr_unique_id = f"{entry.entry_id}-last_brew_time"
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
 
-    @property
-    def native_value(self) -> datetime | None:
+    def _compute_native_value(self) -> datetime | None:
         """Return the last brew completion time using historical data."""
+        coordinator = self.coordinator
         # Try historical data first, fallback to device data
-        historical_time = self.coordinator.history_manager.get_last_brew_time()
+        historical_time = coordinator.history_snapshot.last_brew_time
         if historical_time:
             # Ensure timezone is set
             if historical_time.tzinfo is None:
@@ -336,156 +332,73 @@ class AidenLastBrewTimeSensor(FellowAidenBaseEntity, SensorEntity):
             return historical_time
             
         # Fallback to device data
-        data = self.coordinator.data
-        if not data:
+        derived = coordinator.derived
+        if derived.last_brew_end_ts is None:
             return None
-        device_config = data.get("device_config", {})
-        end_time_str = device_config.get("brewEndTime")
+        return derived.brew_datetimes["brewEndTime"]
 
-        if not end_time_str or end_time_str == "0":
-            return None
 
-        try:
-            timestamp_int = int(end_time_str)
-            if timestamp_int == 0 or timestamp_int < TIMESTAMP_2024_01_01:  # Before 2024
-                return None
-            # Create timezone-aware datetime
-            return dt_util.utc_from_timestamp(timestamp_int)
-        except (ValueError, TypeError) as error:
-            _LOGGER.error("Error parsing last brew time: %s", error)
-            return None
+class AidenTotalWaterPeriodSensor(AidenCachedAttributesSensor):
+    """Water used over a rolling period, from historical tracking data."""
 
-
-class AidenTotalWaterTodaySensor(FellowAidenBaseEntity, SensorEntity):
-    """Water used today, from historical tracking data."""
+    _attr_native_unit_of_measurement = UnitOfVolume.LITERS
+    _attr_device_class = SensorDeviceClass.VOLUME
+    _attr_state_class = SensorStateClass.TOTAL
 
     def __init__(
         self,
         coordinator: FellowAidenDataUpdateCoordinator,
         entry: ConfigEntry,
+        days: int,
+        translation_key: str,
+        unique_id_suffix: str,
+        brew_count_key: str | None,
     ) -> None:
         super().__init__(coordinator)
         self._entry_id = entry.entry_id
-        self._attr_translation_key = "total_water_today"
-        self._attr_unique_id = f"{entry.entry_id}-total_water_today"
-        self._attr_native_unit_of_measurement = UnitOfVolume.LITERS
-        self._attr_device_class = SensorDeviceClass.VOLUME
-        self._attr_state_class = SensorStateClass.TOTAL
+        self._days = days
+        self._brew_count_key = brew_count_key
+        self._attr_translation_key = translation_key
+        self._attr_unique_id = f"{entry.entry_id}-{unique_id_suffix}"
 
     @property
     def native_value(self) -> float | None:
-        """Return total water used today using historical data."""
+        """Return total water used in the period using historical data."""
         # IMPORTANT: Only use historical tracking data, never fallback to device totals
-        water_usage = self.coordinator.history_manager.get_water_usage_for_period(1)
-        _LOGGER.debug("Water usage today from history: %s L", water_usage)
-        
-        # Ensure we never accidentally return device lifetime totals
-        if water_usage is None or water_usage < 0:
-            _LOGGER.warning("Invalid water usage value from history manager, returning 0.0")
-            return 0.0
-            
-        return water_usage
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional attributes."""
-        water_records = self.coordinator.history_manager.get_water_usage_count()
-        return {
-            "historical_records": water_records,
-            "accuracy": "High - based on actual usage tracking" if water_records > 0 else "Low - no historical data yet",
-            "note": f"Calculated from {water_records} water usage records"
-        }
-
-
-class AidenTotalWaterWeekSensor(FellowAidenBaseEntity, SensorEntity):
-    """Water used this week, from historical tracking data."""
-
-    def __init__(
-        self,
-        coordinator: FellowAidenDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        super().__init__(coordinator)
-        self._entry_id = entry.entry_id
-        self._attr_translation_key = "total_water_this_week"
-        self._attr_unique_id = f"{entry.entry_id}-total_water_week"
-        self._attr_native_unit_of_measurement = UnitOfVolume.LITERS
-        self._attr_device_class = SensorDeviceClass.VOLUME
-        self._attr_state_class = SensorStateClass.TOTAL
+        water_usage = self.coordinator.history_snapshot.water_usage.get(self._days, 0.0)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Water usage over %d days from history: %s L", self._days, water_usage)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return total water used this week using historical data."""
-        # IMPORTANT: Only use historical tracking data, never fallback to device totals
-        water_usage = self.coordinator.history_manager.get_water_usage_for_period(7)
-        _LOGGER.debug("Water usage this week from history: %s L", water_usage)
-        
         # Ensure we never accidentally return device lifetime totals
         if water_usage is None or water_usage < 0:
             _LOGGER.warning("Invalid water usage value from history manager, returning 0.0")
             return 0.0
-            
-        return water_usage
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional attributes."""
-        water_records = self.coordinator.history_manager.get_water_usage_count()
-        brew_count = self.coordinator.history_manager.get_brew_count_for_period(7)
-        return {
-            "historical_records": water_records,
-            "brews_this_week": brew_count,
-            "accuracy": "High - based on actual usage tracking" if water_records > 0 else "Low - no historical data yet",
-            "note": f"Calculated from {water_records} water usage records"
-        }
-
 
-class AidenTotalWaterMonthSensor(FellowAidenBaseEntity, SensorEntity):
-    """Water used this month, from historical tracking data."""
-
-    def __init__(
-        self,
-        coordinator: FellowAidenDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        super().__init__(coordinator)
-        self._entry_id = entry.entry_id
-        self._attr_translation_key = "total_water_this_month"
-        self._attr_unique_id = f"{entry.entry_id}-total_water_month"
-        self._attr_native_unit_of_measurement = UnitOfVolume.LITERS
-        self._attr_device_class = SensorDeviceClass.VOLUME
-        self._attr_state_class = SensorStateClass.TOTAL
-
-    @property
-    def native_value(self) -> float | None:
-        """Return total water used this month using historical data."""
-        # IMPORTANT: Only use historical tracking data, never fallback to device totals
-        water_usage = self.coordinator.history_manager.get_water_usage_for_period(30)
-        _LOGGER.debug("Water usage this month from history: %s L", water_usage)
-        
-        # Ensure we never accidentally return device lifetime totals
-        if water_usage is None or water_usage < 0:
-            _LOGGER.warning("Invalid water usage value from history manager, returning 0.0")
-            return 0.0
-            
         return water_usage
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        water_records = self.coordinator.history_manager.get_water_usage_count()
-        brew_count = self.coordinator.history_manager.get_brew_count_for_period(30)
-        return {
-            "historical_records": water_records,
-            "brews_this_month": brew_count,
-            "accuracy": "High - based on actual usage tracking" if water_records > 0 else "Low - no historical data yet",
-            "note": f"Calculated from {water_records} water usage records"
-        }
+        snapshot = self.coordinator.history_snapshot
+        water_records = snapshot.water_usage_count
+        attrs: dict[str, Any] = {"historical_records": water_records}
+        if self._brew_count_key:
+            attrs[self._brew_count_key] = snapshot.brew_count.get(self._days, 0)
+        if water_records > 0:
+            attrs["accuracy"] = "High - based on actual usage tracking"
+        else:
+            attrs["accuracy"] = "Low - no historical data yet"
+        attrs["note"] = f"Calculated from {water_records} water usage records"
+        return attrs
 
 
-class AidenAverageBrewDurationSensor(FellowAidenBaseEntity, SensorEntity):
+class AidenAverageBrewDurationSensor(AidenCachedAttributesSensor):
     """Average brew duration across historical data, with last-brew fallback."""
 
+    _attr_translation_key = "average_brew_duration"
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(
         self,
         coordinator: FellowAidenDataUpdateCoordinator,
@@ -493,52 +406,27 @@ class AidenAverageBrewDurationSensor(FellowAidenBaseEntity, SensorEntity):
     ) -> None:
         super().__init__(coordinator)
         self._entry_id = entry.entry_id
-        self._attr_translation_key = "average_brew_duration"
         self._attr_unique_id = f"{entry.entry_id}-avg_brew_duration"
-        self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
-        self._attr_device_class = SensorDeviceClass.DURATION
 
     @property
     def native_value(self) -> float | None:
         """Return the average brew duration using historical data."""
-        historical_avg = self.coordinator.history_manager.get_average_brew_duration()
+        coordinator = self.coordinator
+        historical_avg = coordinator.history_snapshot.average_brew_duration
         if historical_avg is not None:
             return historical_avg
             
         # Fallback to last brew duration if no historical data
-        data = self.coordinator.data
-        if not data:
+        duration_seconds = coordinator.derived.last_brew_duration
+        if duration_seconds is None:
             return None
-        device_config = data.get("device_config", {})
-        start_time_str = device_config.get("brewStartTime")
-        end_time_str = device_config.get("brewEndTime")
-
-        if not start_time_str or not end_time_str:
-            return None
-
-        try:
-            start_timestamp = int(start_time_str)
-            end_timestamp = int(end_time_str)
-
-            if start_timestamp == 0 or end_timestamp == 0:
-                return None
-            if start_timestamp < TIMESTAMP_2024_01_01 or end_timestamp < TIMESTAMP_2024_01_01:
-                return None
-
-            duration_seconds = end_timestamp - start_timestamp
-            if duration_seconds < 0:
-                return None
+        return round(duration_seconds / 60.0, 1)  # Convert to minutes
 
-            return round(duration_seconds / 60.0, 1)  # Convert to minutes
-        except (ValueError, TypeError) as error:
-            _LOGGER.error("Error calculating brew duration: %s", error)
-            return None
-
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        brew_records = self.coordinator.history_manager.get_brew_history_count()
-        historical_avg = self.coordinator.history_manager.get_average_brew_duration()
+        snapshot = self.coordinator.history_snapshot
+        brew_records = snapshot.brew_history_count
+        historical_avg = snapshot.average_brew_duration
         return {
             "historical_brews": brew_records,
             "accuracy": "High - based on historical averages" if historical_avg else "Low - using last brew only",
@@ -546,9 +434,13 @@ class AidenAverageBrewDurationSensor(FellowAidenBaseEntity, SensorEntity):
         }
 
 
-class AidenMostPopularProfileSensor(FellowAidenBaseEntity, SensorEntity):
+class AidenMostPopularProfileSensor(AidenCachedAttributesSensor):
     """Most-brewed profile, based on historical usage counts."""
 
+    _attr_translation_key = "most_popular_profile"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
     def __init__(
         self,
         coordinator: FellowAidenDataUpdateCoordinator,
@@ -556,42 +448,38 @@ class AidenMostPopularProfileSensor(FellowAidenBaseEntity, SensorEntity):
     ) -> None:
         super().__init__(coordinator)
         self._entry_id = entry.entry_id
-        self._attr_translation_key = "most_popular_profile"
         self._attr_unique_id = f"{entry.entry_id}-most_popular_profile"
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_entity_registry_enabled_default = False
 
     @property
     def native_value(self) -> str | None:
         """Return the most popular profile name using historical data."""
+        coordinator = self.coordinator
         # Try to get most popular from historical data
-        most_popular = self.coordinator.history_manager.get_most_popular_profile()
+        most_popular = coordinator.derived.most_popular_profile
         if most_popular:
             return most_popular
             
         # Fallback to default or first profile
-        data = self.coordinator.data
+        data = coordinator.data
         if not data or "profiles" not in data or not data["profiles"]:
             return "No profiles available"
         
         # Look for default profile first
-        default_profile = next(
-            (p for p in data["profiles"] if p.get("isDefaultProfile")), 
-            None
-        )
+        default_profile = coordinator.derived.default_profile
         if default_profile:
             return default_profile.get("title", "Default Profile")
         
         # Otherwise return the first profile
         return data["profiles"][0].get("title", "Profile 1")
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        data = self.coordinator.data
+        coordinator = self.coordinator
+        data = coordinator.data
         total_profiles = len(data.get("profiles", [])) if data else 0
-        profile_stats = self.coordinator.history_manager.get_profile_usage_stats()
-        most_popular = self.coordinator.history_manager.get_most_popular_profile()
+        derived = coordinator.derived
+        profile_stats = derived.profile_usage_stats
+        most_popular = derived.most_popular_profile
         
         attrs = {
             "total_profiles": total_profiles,
@@ -600,7 +488,7 @@ class AidenMostPopularProfileSensor(FellowAidenBaseEntity, SensorEntity):
         
         if most_popular and profile_stats:
             attrs["accuracy"] = "High - based on actual usage tracking"
-            attrs["note"] = f"Based on {sum(profile_stats.values())} recorded brews"
+            attrs["note"] = f"Based on {derived.profile_usage_total} recorded brews"
             attrs["usage_count"] = profile_stats.get(most_popular, 0)
         else:
             attrs["accuracy"] = "Low - using default/first profile"
@@ -609,9 +497,11 @@ class AidenMostPopularProfileSensor(FellowAidenBaseEntity, SensorEntity):
         return attrs
 
 
-class AidenCurrentProfileSensor(FellowAidenBaseEntity, SensorEntity):
+class AidenCurrentProfileSensor(AidenCachedAttributesSensor):
     """The currently selected or most recently used brew profile."""
 
+    _attr_translation_key = "current_profile"
+
     def __init__(
         self,
         coordinator: FellowAidenDataUpdateCoordinator,
@@ -619,7 +509,6 @@ class AidenCurrentProfileSensor(FellowAidenBaseEntity, SensorEntity):
     ) -> None:
         super().__init__(coordinator)
         self._entry_id = entry.entry_id
-        self._attr_translation_key = "current_profile"
         self._attr_unique_id = f"{entry.entry_id}-current_profile"
 
     def _detect_current_profile(self) -> tuple[str | None, str, str]:
@@ -639,49 +528,27 @@ class AidenCurrentProfileSensor(FellowAidenBaseEntity, SensorEntity):
 
     def _compute_current_profile(self) -> tuple[str | None, str, str]:
         """Run the actual detection logic."""
-        data = self.coordinator.data
+        coordinator = self.coordinator
+        data = coordinator.data
+        derived = coordinator.derived
 
-        if data and "profiles" in data and data["profiles"]:
-            # Method 1: Check against the "ibSelectedProfileId" field, if set.
-            device_config = data.get("device_config")
-            if device_config:
-                selected_profile_id = device_config.get("ibSelectedProfileId")
-                if selected_profile_id:
-                    selected_profile = next(
-                        (p for p in data["profiles"] if p.get("id") == selected_profile_id),
-                        None
-                    )
-                    if selected_profile:
-                        return selected_profile.get("title", "Selected Profile"), "Selected Profile Id", "very_high"
-
-            # Method 2: Check for most recently used profile by lastUsedTime
-            profiles_with_last_used = []
-            for profile in data["profiles"]:
-                last_used = profile.get("lastUsedTime")
-                if last_used and last_used != "0":
-                    try:
-                        last_used_timestamp = int(last_used)
-                        if last_used_timestamp > 0:
-                            profiles_with_last_used.append((profile, last_used_timestamp))
-                    except (ValueError, TypeError):
-                        continue
-
-            if profiles_with_last_used:
-                profiles_with_last_used.sort(key=lambda x: x[1], reverse=True)
-                most_recent_profile = profiles_with_last_used[0][0]
-                return most_recent_profile.get("title", "Recent Profile"), "Recent Profile", "very_high"
+        # Method 1: Check against the "ibSelectedProfileId" field, if set.
+        selected_profile = derived.selected_profile
+        if selected_profile:
+            return selected_profile.get("title", "Selected Profile"), "Selected Profile Id", "very_high"
+
+        # Method 2: Check for most recently used profile by lastUsedTime
+        most_recent_profile = derived.most_recent_profile
+        if most_recent_profile:
+            return most_recent_profile.get("title", "Recent Profile"), "Recent Profile", "very_high"
 
         # Method 3: Check for default profile flag
-        if data and "profiles" in data and data["profiles"]:
-            default_profile = next(
-                (p for p in data["profiles"] if p.get("isDefaultProfile")),
-                None
-            )
-            if default_profile:
-                return default_profile.get("title", "Default Profile"), "Default Profile", "medium"
+        default_profile = derived.default_profile
+        if default_profile:
+            return default_profile.get("title", "Default Profile"), "Default Profile", "medium"
 
         # Method 4: Use most popular profile from history
-        most_popular = self.coordinator.history_manager.get_most_popular_profile()
+        most_popular = derived.most_popular_profile
         if most_popular:
             return most_popular, "historical_usage", "low_medium"
 
@@ -697,36 +564,23 @@ class AidenCurrentProfileSensor(FellowAidenBaseEntity, SensorEntity):
         value, _, _ = self._detect_current_profile()
         return value
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _build_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
+        coordinator = self.coordinator
         _, detection_method, confidence = self._detect_current_profile()
-        data = self.coordinator.data
+        data = coordinator.data
         total_profiles = len(data.get("profiles", [])) if data else 0
 
         last_used_time = None
 
-        if data and "profiles" in data and data["profiles"]:
-            # Get last used time for display
-            profiles_with_last_used = []
-            for profile in data["profiles"]:
-                last_used = profile.get("lastUsedTime")
-                if last_used and last_used != "0":
-                    try:
-                        last_used_timestamp = int(last_used)
-                        if last_used_timestamp > 0:
-                            profiles_with_last_used.append((profile, last_used_timestamp))
-                    except (ValueError, TypeError):
-                        continue
-
-            if profiles_with_last_used:
-                profiles_with_last_used.sort(key=lambda x: x[1], reverse=True)
-                most_recent_timestamp = profiles_with_last_used[0][1]
-                try:
-                    last_used_dt = dt_util.as_local(dt_util.utc_from_timestamp(most_recent_timestamp))
-                    last_used_time = last_used_dt.isoformat()
-                except (ValueError, OSError, OverflowError):
-                    pass
+        # Get last used time for display
+        most_recent_timestamp = coordinator.derived.most_recent_profile_ts
+        if most_recent_timestamp:
+            try:
+                last_used_dt = dt_util.as_local(dt_util.utc_from_timestamp(most_recent_timestamp))
+                last_used_time = last_used_dt.isoformat()
+            except (ValueError, OSError, OverflowError):
+                pass
 
         attrs = {
             "total_profiles": total_profiles,
@@ -739,37 +593,35 @@ class AidenCurrentProfileSensor(FellowAidenBaseEntity, SensorEntity):
             attrs["last_used_time"] = last_used_time
 
         # Add last brew information if available
-        last_brew_time = self.coordinator.history_manager.get_last_brew_time()
+        last_brew_time = coordinator.history_snapshot.last_brew_time
         if last_brew_time:
             attrs["last_brew_time"] = last_brew_time.isoformat()
 
         # Add profile usage stats
-        profile_stats = self.coordinator.history_manager.get_profile_usage_stats()
+        derived = coordinator.derived
+        profile_stats = derived.profile_usage_stats
         if profile_stats:
             attrs["profile_usage_stats"] = profile_stats
-            attrs["total_historical_brews"] = sum(profile_stats.values())
+            attrs["total_historical_brews"] = derived.profile_usage_total
 
         return attrs
 
 
-class AidenBasketSensor(FellowAidenBaseEntity, SensorEntity):
+class AidenBasketSensor(AidenComputedSensor):
     """Which basket is inserted: single serve, batch brew, or missing."""
 
+    _attr_translation_key = "basket"
+
     def __init__(self, coordinator: FellowAidenDataUpdateCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator)
         self._entry_id = entry.entry_id
-        self._attr_translation_key = "basket"
         self._attr_unique_id = f"{entry.entry_id}-basket"
 
-    @property
-    def native_value(self) -> str:
-        data = self.coordinator.data or {}
-        device_config = data.get("device_config", {})
-        single_basket = device_config.get("singleBrewBasketPresent", False)
-        batch_basket = device_config.get("batchBrewBasketPresent", False)
-
-        if single_basket:
+    def _compute_native_value(self) -> str:
+        """Derive the basket state from the coordinator's device config."""
+        device_config = self.coordinator.device_config
+        if device_config.get("singleBrewBasketPresent", False):
             return "Single Serve"
-        if batch_basket:
+        if device_config.get("batchBrewBasketPresent", False):
             return "Batch Brew"
         return "Missing"